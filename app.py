@@ -1,8 +1,24 @@
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
-import feedparser
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlsplit
+import diskcache
 import requests
 from dateutil import tz
-from flask import Flask, render_template_string
+from flask import Flask
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util import Retry, make_headers
 
 app = Flask(__name__)
 
@@ -10,7 +26,8 @@ INDIA_TZ = tz.gettz("Asia/Kolkata")
 
 # ------------------ 1) RSS FEEDS ------------------
 # These are the feeds we use. Any feed that returns entries
-# will get AT LEAST one story shown on the page.
+# will get AT LEAST one story shown on the page – unless every one of
+# its stories is already shown under the exact same link from another feed.
 FEEDS = {
     # Moneycontrol – latest news
     "Moneycontrol": "http://www.moneycontrol.com/rss/latestnews.xml",
@@ -33,6 +50,26 @@ FEEDS = {
 # How far back to prefer (in hours)
 HOURS_WINDOW = 24
 
+# At most N stories are kept per feed; at most 120 make it onto the page.
+# Feeds that list newest first stop being parsed after N stories.
+MAX_ENTRIES_PER_FEED = 60
+
+# After stopping early, up to this much of the unread body is read and
+# thrown away so the keep-alive connection can be reused; a longer rest
+# isn't worth downloading, so that connection is closed instead (in bytes)
+MAX_DRAIN_BYTES = 256 * 1024
+
+# Feeds NOT listed newest first (Google News search ranks by relevance):
+# these are parsed in full and then trimmed to their N newest stories.
+RELEVANCE_ORDERED_FEEDS = {"Google News - India Markets"}
+
+# How often the background thread re-fetches all feeds (in seconds)
+REFRESH_INTERVAL_SECONDS = 60
+
+# How long the first request of a process waits for the initial fetch
+# before showing the empty state instead (in seconds)
+FIRST_LOAD_WAIT_SECONDS = 5
+
 # HTTP session with a browser-like User-Agent
 SESSION = requests.Session()
 SESSION.headers.update({
@@ -43,116 +80,392 @@ SESSION.headers.update({
     )
 })
 
+# Ask for compressed bodies. make_headers() only advertises "br" when a
+# brotli package is installed, so we never get a body we can't decode.
+SESSION.headers.update(make_headers(accept_encoding=True))
+
+# Keep-alive pool per host (reused across refreshes and fetch threads),
+# plus a couple of quick retries for connection errors / 5xx responses.
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Per-URL validators from the last successful fetch, used for conditional GETs.
+# Kept on disk so a restarted process (or another worker) can send them too:
+# "meta:v<N>:<url>" -> {"etag": ..., "last_modified": ..., "items": [...]}
+# Stored as JSON (JSONDisk), never pickled, so reading the cache can't run
+# code. Set FEED_CACHE_DIR to choose where; the default is in the user's
+# own cache directory rather than the shared, world-writable temp dir.
+FEED_CACHE_DIR = os.environ.get("FEED_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "india-finance-pulse", "feeds"
+)
+FEED_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+# Bump when the shape of cached items changes, so old entries are ignored
+FEED_CACHE_VERSION = 3
+
+
+class MemoryFeedCache(dict):
+    """
+    Stand-in for the disk cache when it can't be opened: same get / set /
+    touch calls, but entries live only as long as this process (no expiry).
+    """
+
+    def get(self, key, default=None):
+        # A copy, like a fresh read from disk, so callers can't edit the entry
+        return dict(self[key]) if key in self else default
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+        return True
+
+    def touch(self, key, expire=None):
+        return key in self
+
+
+def open_feed_cache():
+    """
+    Open the on-disk feed cache. If the directory can't be created or the
+    database can't be opened (read-only or missing home, ...), keep going
+    with an in-memory cache: conditional GETs still work, they just don't
+    survive a restart.
+    """
+    try:
+        return diskcache.Cache(FEED_CACHE_DIR, disk=diskcache.JSONDisk)
+    except (OSError, sqlite3.Error) as e:
+        print(f"[WARN] Feed cache unavailable at {FEED_CACHE_DIR}, keeping it in memory: {e}")
+        return MemoryFeedCache()
+
+
+FEED_CACHE = open_feed_cache()
+
 
 # ------------------ 2) FETCHING + NORMALISATION ------------------
-def extract_image(entry):
-    """Try to find an image URL in common media fields."""
-    media_content = getattr(entry, "media_content", None)
-    if media_content:
-        if isinstance(media_content, list) and media_content:
-            url = media_content[0].get("url")
-            if url:
-                return url
-        elif isinstance(media_content, dict):
-            url = media_content.get("url")
-            if url:
-                return url
+# XML namespaces, in lxml's Clark notation
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+# Story elements we stream out of a feed: RSS <item> and Atom <entry>
+ENTRY_TAGS = ("item", ATOM_NS + "entry")
+
+# Plain-text child element -> feedparser-style entry key.
+# <description>/<summary> are skipped on purpose: the page never shows
+# them and they are often the bulkiest part of an item.
+TEXT_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "pubDate": "published",
+    DC_NS + "date": "updated",
+    ATOM_NS + "title": "title",
+    ATOM_NS + "published": "published",
+    ATOM_NS + "updated": "updated",
+}
 
-    media_thumb = getattr(entry, "media_thumbnail", None)
-    if media_thumb:
-        if isinstance(media_thumb, list) and media_thumb:
-            url = media_thumb[0].get("url")
-            if url:
-                return url
-        elif isinstance(media_thumb, dict):
-            url = media_thumb.get("url")
+
+@dataclass(slots=True)
+class Item:
+    """One story, normalised from whichever feed it came from."""
+    source: str         # visible publisher name
+    feed: str           # which FEED this came from
+    title: str
+    link: str
+    dt_utc: datetime
+    dt_ist: datetime
+    dt_display: str     # dt_ist pre-formatted for the card
+    image: str | None
+
+
+def item_to_cache(item):
+    """Item -> JSON-able dict for FEED_CACHE (datetimes as ISO strings)."""
+    data = asdict(item)
+    data["dt_utc"] = item.dt_utc.isoformat()
+    data["dt_ist"] = item.dt_ist.isoformat()
+    return data
+
+
+def item_from_cache(data):
+    """Inverse of item_to_cache()."""
+    return Item(**{
+        **data,
+        "dt_utc": datetime.fromisoformat(data["dt_utc"]),
+        "dt_ist": datetime.fromisoformat(data["dt_ist"]),
+    })
+
+
+def _iter_story_elements(source):
+    """
+    Yield each <item>/<entry> element of a feed. A body that is not XML at
+    all (empty, or an HTML error page) just yields nothing, like
+    feedparser's zero entries, instead of raising out of the fetch.
+    """
+    try:
+        for _, elem in etree.iterparse(
+            source, events=("end",), tag=ENTRY_TAGS, recover=True
+        ):
+            yield elem
+    except etree.XMLSyntaxError as e:
+        print(f"[WARN] Feed body is not usable XML: {e}")
+
+
+def parse_rss_stream(source):
+    """
+    Stream stories out of an RSS/Atom document (a file-like object) and
+    yield one feedparser-style dict per <item>/<entry>, holding only the
+    fields the page uses. Each story element is dropped from the tree once
+    read, so memory stays flat on long feeds. `recover=True` keeps going
+    past the odd malformed bit of XML, like feedparser did.
+    """
+    for elem in _iter_story_elements(source):
+        entry = {"links": []}
+
+        for child in elem.iterchildren():
+            tag = child.tag
+            if tag in TEXT_FIELDS:
+                if child.text and child.text.strip():
+                    entry.setdefault(TEXT_FIELDS[tag], child.text.strip())
+            elif tag == "enclosure":
+                entry["links"].append(
+                    {"type": child.get("type", ""), "href": child.get("url", "")}
+                )
+            elif tag == ATOM_NS + "link":
+                rel = child.get("rel", "alternate")
+                href = child.get("href", "")
+                entry["links"].append(
+                    {"rel": rel, "type": child.get("type", ""), "href": href}
+                )
+                if rel == "alternate" and href:
+                    entry.setdefault("link", href)
+            elif tag == "source":
+                # Google News: <source url="...">The Hindu</source>
+                entry["source"] = {"title": (child.text or "").strip()}
+            elif tag == ATOM_NS + "source":
+                entry["source"] = {"title": child.findtext(ATOM_NS + "title", "").strip()}
+
+        # media:* may also sit inside a <media:group>, so search the subtree
+        for media in elem.iter(MEDIA_NS + "content", MEDIA_NS + "thumbnail"):
+            key = "media_content" if media.tag == MEDIA_NS + "content" else "media_thumbnail"
+            entry.setdefault(key, []).append(dict(media.attrib))
+
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+        yield entry
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """
+    Turn an RSS (RFC 822) or Atom (ISO 8601) date string into an aware UTC
+    datetime. Returns None if the string can't be understood.
+    Cached: most stories are still in the feed on the next refresh, so the
+    same date strings come back again and again.
+    """
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def extract_image(entry):
+    """
+    Try to find an image URL in common media fields: the first
+    media:content, then the first media:thumbnail, then any image link.
+    parse_rss_stream always stores the media fields as lists of dicts.
+    """
+    for field in ("media_content", "media_thumbnail"):
+        media = entry.get(field)
+        if media:
+            url = media[0].get("url")
             if url:
                 return url
 
-    for link in getattr(entry, "links", []):
-        link_type = getattr(link, "type", "") or link.get("type", "")
-        href = getattr(link, "href", "") or link.get("href", "")
-        if link_type and link_type.startswith("image/") and href:
-            return href
-
-    return None
+    return next(
+        (
+            link["href"]
+            for link in entry.get("links", ())
+            if link.get("type", "").startswith("image/") and link.get("href")
+        ),
+        None,
+    )
 
 
 def get_publisher_name(default_source_name, entry):
     """
     Try to show the *actual news publisher*:
-    - For Google News, entry.source.title is usually like 'The Hindu', 'Economic Times', etc.
+    - For Google News, entry["source"]["title"] is usually like 'The Hindu', 'Economic Times', etc.
     - For direct feeds (Moneycontrol, BS, The Hindu) it may also be present.
     If not found, fall back to the feed name (default_source_name).
     """
     publisher = default_source_name
 
-    src = getattr(entry, "source", None)
+    src = entry.get("source")
     if src:
-        # attribute form
-        title_attr = getattr(src, "title", None) or getattr(src, "name", None)
-        if title_attr:
-            publisher = title_attr
-        else:
-            # dict-like form
-            try:
-                title_dict = src.get("title") or src.get("name")
-                if title_dict:
-                    publisher = title_dict
-            except Exception:
-                pass
+        title = src.get("title") or src.get("name")
+        if title:
+            publisher = title
 
     return publisher
 
 
 def fetch_feed(source_name, url):
-    """Fetch one RSS feed using requests + feedparser."""
+    """
+    Fetch one RSS feed using requests + parse_rss_stream.
+    Sends the ETag / Last-Modified we saw last time, so an unchanged feed
+    comes back as a bodyless 304 and we reuse the items parsed before.
+    """
     print(f"[INFO] Fetching: {source_name} -> {url}")
+    cache_key = f"meta:v{FEED_CACHE_VERSION}:{url}"
+    try:
+        meta = FEED_CACHE.get(cache_key, default={})
+        if "items" in meta:
+            meta["items"] = [item_from_cache(d) for d in meta["items"]]
+    except (OSError, sqlite3.Error, KeyError, TypeError, ValueError) as e:
+        # Disk/database trouble, or an entry whose items don't match Item's
+        # fields → treat as a miss; the next 200 overwrites the entry
+        print(f"[WARN] Ignoring unreadable cache entry for {source_name}: {e}")
+        meta = {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    # stream=True: the body is parsed straight off the socket below
+    # instead of being buffered whole into resp.content first
+    resp = None
     try:
-        resp = SESSION.get(url, timeout=10)
+        resp = SESSION.get(url, timeout=10, headers=headers, stream=True)
         resp.raise_for_status()
     except Exception as e:
         print(f"[ERROR] HTTP error for {source_name}: {e}")
+        if resp is not None:
+            resp.close()
         return []
 
-    parsed = feedparser.parse(resp.content)
-    print(f"[INFO]  {source_name}: HTTP {resp.status_code}, entries={len(parsed.entries)}")
-
-    items = []
-    for entry in parsed.entries:
-        dt_struct = getattr(entry, "published_parsed", None) or getattr(
-            entry, "updated_parsed", None
-        )
-
-        if dt_struct:
-            dt_utc = datetime(*dt_struct[:6], tzinfo=timezone.utc)
+    with resp:
+        if resp.status_code == 304 and "items" in meta:
+            print(f"[INFO]  {source_name}: HTTP 304, reusing {len(meta['items'])} items")
+            try:
+                # Still current: restart the expiry so an unchanged feed's
+                # entry doesn't lapse and cost a full download a day later
+                FEED_CACHE.touch(cache_key, expire=FEED_CACHE_EXPIRE_SECONDS)
+            except (OSError, sqlite3.Error) as e:
+                print(f"[WARN] Could not refresh cache expiry for {source_name}: {e}")
+            return meta["items"]
+
+        # Let urllib3 undo gzip/br while lxml reads
+        resp.raw.decode_content = True
+
+        # Stories without a timestamp are treated as published when first fetched
+        fetched_at = datetime.now(timezone.utc)
+
+        # Globals used per story, bound to locals once: the loop body then
+        # does fast local lookups instead of globals()/builtins dict lookups
+        _parse_date = parse_date
+        _extract_image = extract_image
+        _get_publisher_name = get_publisher_name
+        _item = Item
+        _ist = INDIA_TZ
+
+        entries = parse_rss_stream(resp.raw)
+        relevance_ordered = source_name in RELEVANCE_ORDERED_FEEDS
+        if not relevance_ordered:
+            # islice stops the stream parser (and the download) after N stories
+            entries = islice(entries, MAX_ENTRIES_PER_FEED)
+
+        items = []
+        items_append = items.append
+        for entry in entries:
+            dt_utc = _parse_date(entry.get("published") or entry.get("updated")) or fetched_at
+            dt_ist = dt_utc.astimezone(_ist)
+
+            image_url = _extract_image(entry)
+            publisher = _get_publisher_name(source_name, entry)
+
+            items_append(
+                _item(
+                    source=publisher,
+                    feed=source_name,
+                    title=entry.get("title", "No title"),
+                    link=entry.get("link", ""),
+                    dt_utc=dt_utc,
+                    dt_ist=dt_ist,
+                    dt_display=dt_ist.strftime("%d %b, %H:%M"),
+                    image=image_url,
+                )
+            )
+
+        if relevance_ordered:
+            items = heapq.nlargest(MAX_ENTRIES_PER_FEED, items, key=lambda it: it.dt_utc)
         else:
-            dt_utc = None  # handle later
+            # Closing with body left unread drops the connection, so read
+            # off a short remainder first (no-op once the body is done)
+            try:
+                resp.raw.read(MAX_DRAIN_BYTES)
+            except (OSError, Urllib3HTTPError) as e:
+                print(f"[WARN] Could not finish reading {source_name}: {e}")
 
-        image_url = extract_image(entry)
-        publisher = get_publisher_name(source_name, entry)
+    print(f"[INFO]  {source_name}: HTTP {resp.status_code}, entries={len(items)}")
 
-        items.append(
+    try:
+        FEED_CACHE.set(
+            cache_key,
             {
-                "source": publisher,        # visible publisher name
-                "feed": source_name,        # which FEED this came from
-                "title": getattr(entry, "title", "No title"),
-                "link": getattr(entry, "link", ""),
-                "summary": getattr(entry, "summary", ""),
-                "dt_utc": dt_utc,
-                "image": image_url,
-            }
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "items": [item_to_cache(it) for it in items],
+            },
+            expire=FEED_CACHE_EXPIRE_SECONDS,
         )
-
+    except (OSError, sqlite3.Error) as e:
+        # A cache write failing must not throw away a freshly parsed feed
+        print(f"[WARN] Could not cache {source_name}: {e}")
     return items
 
 
+# One long-lived pool of fetch threads, reused by every refresh instead of
+# starting (and tearing down) a fresh set of threads each minute.
+FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=len(FEEDS), thread_name_prefix="feed-fetch"
+)
+
+
 def fetch_all():
-    """Fetch all feeds without killing the app if one fails."""
+    """
+    Fetch all feeds concurrently without killing the app if one fails.
+    Fetching is network-bound, so one thread per feed turns the total
+    wait into roughly the slowest feed instead of the sum of all of them.
+    """
     all_items = []
-    for name, url in FEEDS.items():
+    futures = {
+        FETCH_EXECUTOR.submit(fetch_feed, name, url): name
+        for name, url in FEEDS.items()
+    }
+    for future in as_completed(futures):
+        name = futures[future]
         try:
-            feed_items = fetch_feed(name, url)
+            feed_items = future.result()
             all_items.extend(feed_items)
         except Exception as e:
             print(f"[WARN] Failed parsing for {name}: {e}")
@@ -161,73 +474,122 @@ def fetch_all():
 
 
 # ------------------ 3) FILTERING ------------------
+def story_keys(item):
+    """
+    Keys that identify a story; two items sharing any key are duplicates.
+    - Link: host without 'www.', path without trailing slash, and the query
+      minus utm_* tracking params. Catches the same URL in two feeds.
+    - Title: case/whitespace-normalised, with a trailing " - <publisher>"
+      removed. Catches Google News re-syndicating e.g. The Hindu, whose
+      links are news.google.com redirects that never match the URL.
+    """
+    keys = []
+
+    if item.link:
+        parts = urlsplit(item.link)
+        query = "&".join(
+            p for p in parts.query.split("&") if p and not p.startswith("utm_")
+        )
+        keys.append((
+            "link",
+            parts.netloc.lower().removeprefix("www."),
+            parts.path.rstrip("/"),
+            query,
+        ))
+
+    title = item.title
+    suffix = f" - {item.source}"
+    if title.endswith(suffix):
+        title = title[: -len(suffix)]
+    title = " ".join(title.casefold().split())
+    if title and title != "no title":
+        keys.append(("title", title))
+
+    return keys
+
+
 def filter_last_window(items, fallback_limit_per_feed=1, global_limit=120):
     """
-    1) Prefer items from the last HOURS_WINDOW hours (IST).
+    1) Prefer items from the last HOURS_WINDOW hours.
     2) Ensure at least `fallback_limit_per_feed` items from EACH FEED in FEEDS
        (if that feed has any data at all), even if older than the time window.
     3) Sort newest -> oldest and optionally trim to `global_limit`.
+    All comparisons happen on dt_utc. Items come out of fetch_feed with
+    their timestamps already filled in, so this never modifies them.
     """
-    now_ist = datetime.now(INDIA_TZ)
-    cutoff = now_ist - timedelta(hours=HOURS_WINDOW)
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=HOURS_WINDOW)
 
-    # Ensure every item has a dt_ist we can sort on
+    # Bucket items by FEED for the per-feed guarantee below
+    by_feed = defaultdict(list)
     for item in items:
-        if item.get("dt_utc") is not None:
-            item["dt_ist"] = item["dt_utc"].astimezone(INDIA_TZ)
-        else:
-            # No timestamp in feed → treat as "now" for ordering
-            item["dt_ist"] = now_ist
-
-    # 1) Primary list: items within time window
-    within_window = [it for it in items if it["dt_ist"] >= cutoff]
-    within_window.sort(key=lambda x: x["dt_ist"], reverse=True)
+        by_feed[item.feed].append(item)
+
+    # Walk feeds in FEEDS order (not the order fetch threads finished in),
+    # so the same copy of a duplicated story wins on every refresh – and
+    # direct publisher feeds win over the Google News aggregate
+    feed_rank = {name: i for i, name in enumerate(FEEDS)}
+    ordered_feeds = sorted(by_feed, key=lambda name: feed_rank.get(name, len(feed_rank)))
+
+    # 1) Primary list: items within time window, skipping stories we
+    #    already have from another feed
+    final_items = []
+    seen_keys = set()
+    for feed_name in ordered_feeds:
+        for it in by_feed[feed_name]:
+            if it.dt_utc < cutoff:
+                continue
+            keys = story_keys(it)
+            if any(key in seen_keys for key in keys):
+                continue
+            seen_keys.update(keys)
+            final_items.append(it)
 
-    print(f"[INFO] Items after {HOURS_WINDOW}h filter: {len(within_window)}")
+    print(f"[INFO] Items after {HOURS_WINDOW}h filter: {len(final_items)}")
 
-    # Start building the final list from within-window items
-    final_items = list(within_window)
-    seen_keys = {(it["feed"], it["link"]) for it in final_items}
+    # How many from each FEED are already in the filtered list
+    count_in_final = Counter(it.feed for it in final_items)
 
     # 2) Guarantee at least fallback_limit_per_feed items per FEED
     for feed_name in FEEDS.keys():
         # all items from this feed (regardless of time window)
-        feed_items = [it for it in items if it.get("feed") == feed_name]
+        feed_items = by_feed.get(feed_name)
         if not feed_items:
             # This feed either 404'd or returned zero entries
             continue
 
-        # Count how many from this FEED are already in the filtered list
-        already_in = [it for it in final_items if it.get("feed") == feed_name]
-        if len(already_in) >= fallback_limit_per_feed:
+        if count_in_final[feed_name] >= fallback_limit_per_feed:
             # Already satisfied the minimum
             continue
 
         # Need to add some from this feed (even if older than window)
-        feed_items_sorted = sorted(feed_items, key=lambda x: x["dt_ist"], reverse=True)
+        feed_items_sorted = sorted(feed_items, key=lambda x: x.dt_utc, reverse=True)
 
         for cand in feed_items_sorted:
-            key = (cand["feed"], cand["link"])
-            if key in seen_keys:
+            keys = story_keys(cand)
+            # Only an identical link counts as a duplicate here: a matching
+            # title alone must not cost a feed its one guaranteed story
+            if any(key in seen_keys for key in keys if key[0] == "link"):
                 continue
             final_items.append(cand)
-            seen_keys.add(key)
-            already_in.append(cand)
-            if len(already_in) >= fallback_limit_per_feed:
+            seen_keys.update(keys)
+            count_in_final[feed_name] += 1
+            if count_in_final[feed_name] >= fallback_limit_per_feed:
                 break
 
-    # 3) Global sort (newest first) and optional overall trim
-    final_items.sort(key=lambda x: x["dt_ist"], reverse=True)
-
-    if global_limit is not None and len(final_items) > global_limit:
-        final_items = final_items[:global_limit]
+    # 3) Global sort (newest first) and optional overall trim.
+    # nlargest only keeps the top `global_limit` around while scanning,
+    # instead of sorting everything and throwing most of it away.
+    if global_limit is not None:
+        final_items = heapq.nlargest(global_limit, final_items, key=lambda x: x.dt_utc)
+    else:
+        final_items.sort(key=lambda x: x.dt_utc, reverse=True)
 
     # Debug: how many per FEED + per displayed source
     counts_by_feed = {}
     counts_by_source = {}
     for it in final_items:
-        counts_by_feed[it["feed"]] = counts_by_feed.get(it["feed"], 0) + 1
-        counts_by_source[it["source"]] = counts_by_source.get(it["source"], 0) + 1
+        counts_by_feed[it.feed] = counts_by_feed.get(it.feed, 0) + 1
+        counts_by_source[it.source] = counts_by_source.get(it.source, 0) + 1
 
     print("[INFO] Items per FEED (final):", counts_by_feed)
     print("[INFO] Items per SOURCE (final):", counts_by_source)
@@ -509,7 +871,7 @@ TEMPLATE = """
               <div class="source-row">
                 <div class="source-name">{{ item.source }}</div>
                 <div class="time-pill">
-                  {{ item.dt_ist.strftime('%d %b, %H:%M') }} IST
+                  {{ item.dt_display }} IST
                 </div>
               </div>
 
@@ -536,21 +898,79 @@ TEMPLATE = """
 </html>
 """
 
+# Compiled once at import; render_template_string would re-parse and
+# re-compile TEMPLATE on every call. Uses Flask's Jinja environment so
+# autoescaping and filters stay the same.
+COMPILED_TEMPLATE = app.jinja_env.from_string(TEMPLATE)
 
-# ------------------ 5) ROUTE ------------------
-@app.route("/")
-def index():
-    all_items = fetch_all()
-    recent = filter_last_window(all_items)
-    unique_sources = sorted({item["source"] for item in recent})
-    return render_template_string(
-        TEMPLATE,
+
+# ------------------ 5) BACKGROUND REFRESH ------------------
+# Latest rendered page, swapped in whole by the refresher thread
+# (a single dict assignment, so readers never see a half-built page).
+_latest = {"html": None}
+_first_refresh_done = threading.Event()
+_refresher_lock = threading.Lock()
+_refresher_started = False
+
+
+def render_page():
+    """Fetch every feed, filter, and render the full HTML page."""
+    recent = filter_last_window(fetch_all())
+    unique_sources = sorted({item.source for item in recent})
+    return COMPILED_TEMPLATE.render(
         items=recent,
         unique_sources=unique_sources,
         hours_window=HOURS_WINDOW,
     )
 
 
-# ------------------ 6) LOCAL RUN ------------------
+def _refresher():
+    """Rebuild the page every REFRESH_INTERVAL_SECONDS, forever."""
+    while True:
+        try:
+            _latest["html"] = render_page()
+        except Exception as e:
+            print(f"[ERROR] Background refresh failed: {e}")
+        _first_refresh_done.set()
+        time.sleep(REFRESH_INTERVAL_SECONDS)
+
+
+def start_refresher():
+    """
+    Start the refresher thread once per process. Called from the first
+    request rather than at import, so the debug reloader's parent process
+    and a pre-forking server's master never run their own copy.
+    """
+    global _refresher_started
+    with _refresher_lock:
+        if _refresher_started:
+            return
+        threading.Thread(target=_refresher, name="feed-refresher", daemon=True).start()
+        _refresher_started = True
+
+
+# ------------------ 6) ROUTE ------------------
+@app.route("/")
+def index():
+    """
+    Serve the page built by the background refresher, so requests don't
+    wait on the upstream feeds. Only the first requests after start-up
+    wait, and at most FIRST_LOAD_WAIT_SECONDS, for the initial fetch.
+    """
+    start_refresher()
+    _first_refresh_done.wait(timeout=FIRST_LOAD_WAIT_SECONDS)
+
+    html = _latest["html"]
+    if html is None:
+        # First refresh still running or failed outright → show the empty state
+        html = COMPILED_TEMPLATE.render(
+            items=[],
+            unique_sources=[],
+            hours_window=HOURS_WINDOW,
+        )
+    return html
+
+
+# ------------------ 7) LOCAL RUN ------------------
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Keep the on-disk feed cache created at import out of the user's home
+os.environ.setdefault("FEED_CACHE_DIR", tempfile.mkdtemp(prefix="feed-cache-tests-"))
@@ -0,0 +1,187 @@
+import io
+import json
+import sqlite3
+import time
+
+import diskcache
+import pytest
+
+import app
+
+
+def rss(*stories):
+    items = "".join(
+        f"<item><title>{title}</title><link>https://example.com/{title}</link>"
+        f"<pubDate>{date}</pubDate></item>"
+        for title, date in stories
+    )
+    return f"<rss><channel>{items}</channel></rss>".encode("utf-8")
+
+
+class FakeResponse:
+    def __init__(self, body=b"", status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@pytest.fixture
+def feed_cache(tmp_path, monkeypatch):
+    cache = diskcache.Cache(str(tmp_path / "feeds"), disk=diskcache.JSONDisk)
+    monkeypatch.setattr(app, "FEED_CACHE", cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Make SESSION.get return the given responses in order; records request headers."""
+    sent_headers = []
+
+    def install(*responses):
+        pending = list(responses)
+
+        def fake_get(url, headers=None, **kwargs):
+            sent_headers.append(dict(headers or {}))
+            return pending.pop(0)
+
+        monkeypatch.setattr(app.SESSION, "get", fake_get)
+        return sent_headers
+
+    return install
+
+
+# Relevance order: the oldest story comes first, the newest last
+STORIES = [
+    ("old", "Mon, 01 Jan 2024 08:00:00 GMT"),
+    ("middle", "Mon, 01 Jan 2024 09:00:00 GMT"),
+    ("newest", "Mon, 01 Jan 2024 10:00:00 GMT"),
+]
+
+
+def test_newest_first_feeds_stop_after_max_entries(feed_cache, serve, monkeypatch):
+    monkeypatch.setattr(app, "MAX_ENTRIES_PER_FEED", 2)
+    serve(FakeResponse(rss(*STORIES)))
+
+    items = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    assert [it.title for it in items] == ["old", "middle"]
+
+
+@pytest.mark.parametrize("drain_limit, drained", [(1024 * 1024, True), (10, False)])
+def test_early_stop_drains_only_a_short_remainder(
+    feed_cache, serve, monkeypatch, drain_limit, drained
+):
+    monkeypatch.setattr(app, "MAX_ENTRIES_PER_FEED", 1)
+    monkeypatch.setattr(app, "MAX_DRAIN_BYTES", drain_limit)
+    body = rss(*STORIES * 2000)
+    response = FakeResponse(body)
+    serve(response)
+
+    items = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    assert len(items) == 1
+    assert (response.raw.tell() == len(body)) is drained
+
+
+def test_relevance_ordered_feeds_keep_their_newest_stories(feed_cache, serve, monkeypatch):
+    monkeypatch.setattr(app, "MAX_ENTRIES_PER_FEED", 2)
+    serve(FakeResponse(rss(*STORIES)))
+
+    items = app.fetch_feed("Google News - India Markets", "https://example.com/gn")
+
+    assert [it.title for it in items] == ["newest", "middle"]
+
+
+def test_unchanged_feed_reuses_cached_items(feed_cache, serve):
+    sent = serve(
+        FakeResponse(rss(*STORIES), headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}),
+        FakeResponse(status_code=304),
+    )
+
+    first = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+    second = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    assert sent[1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+    assert second == first
+
+
+def test_unchanged_feed_refreshes_cache_expiry(feed_cache, serve):
+    url = "https://example.com/feed"
+    key = f"meta:v{app.FEED_CACHE_VERSION}:{url}"
+    feed_cache.set(key, {"etag": '"v1"', "items": []}, expire=60)
+    serve(FakeResponse(status_code=304))
+
+    app.fetch_feed("Moneycontrol", url)
+
+    _, expire_time = feed_cache.get(key, expire_time=True)
+    assert expire_time > time.time() + app.FEED_CACHE_EXPIRE_SECONDS - 60
+
+
+def test_cache_entries_are_plain_json(feed_cache, serve):
+    serve(FakeResponse(rss(*STORIES), headers={"ETag": '"v1"'}))
+
+    items = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    (key,) = list(feed_cache)
+    stored = feed_cache.get(key)
+    assert json.loads(json.dumps(stored)) == stored
+    assert [app.item_from_cache(d) for d in stored["items"]] == items
+
+
+def test_failed_cache_write_keeps_parsed_items(feed_cache, serve, monkeypatch):
+    def broken_set(*args, **kwargs):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(feed_cache, "set", broken_set)
+    serve(FakeResponse(rss(*STORIES)))
+
+    items = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    assert len(items) == 3
+
+
+def test_unopenable_cache_falls_back_to_memory(serve, monkeypatch):
+    def broken_cache(*args, **kwargs):
+        raise FileNotFoundError("could not create cache directory")
+
+    monkeypatch.setattr(diskcache, "Cache", broken_cache)
+    cache = app.open_feed_cache()
+    monkeypatch.setattr(app, "FEED_CACHE", cache)
+    sent = serve(
+        FakeResponse(rss(*STORIES), headers={"ETag": '"v1"'}),
+        FakeResponse(status_code=304),
+    )
+
+    first = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+    second = app.fetch_feed("Moneycontrol", "https://example.com/feed")
+
+    assert isinstance(cache, app.MemoryFeedCache)
+    assert sent[1] == {"If-None-Match": '"v1"'}
+    assert second == first
+
+
+def test_cache_entry_in_an_old_shape_is_a_miss(feed_cache, serve):
+    url = "https://example.com/feed"
+    feed_cache.set(
+        f"meta:v{app.FEED_CACHE_VERSION}:{url}",
+        {"etag": '"old"', "items": [{"title": "stale", "summary": "no longer a field"}]},
+    )
+    sent = serve(FakeResponse(rss(*STORIES)))
+
+    items = app.fetch_feed("Moneycontrol", url)
+
+    assert sent == [{}]
+    assert len(items) == 3
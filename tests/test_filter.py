@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+from app import Item, filter_last_window, story_keys
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_item(feed, link, title, hours_ago=1, source=None):
+    dt = NOW - timedelta(hours=hours_ago)
+    return Item(
+        source=source or feed,
+        feed=feed,
+        title=title,
+        link=link,
+        dt_utc=dt,
+        dt_ist=dt,
+        dt_display="",
+        image=None,
+    )
+
+
+HINDU = make_item(
+    "The Hindu - Markets",
+    "https://www.thehindu.com/business/markets/sensex-rises/article1.ece",
+    "Sensex rises 500 points",
+    hours_ago=2,
+)
+GOOGLE_COPY = make_item(
+    "Google News - India Markets",
+    "https://news.google.com/rss/articles/CBMiabc?oc=5",
+    "Sensex rises 500 points - The Hindu",
+    hours_ago=1,
+    source="The Hindu",
+)
+# Keeps Google News' guaranteed story from being the syndicated copy
+GOOGLE_UNIQUE = make_item(
+    "Google News - India Markets",
+    "https://news.google.com/rss/articles/CBMixyz?oc=5",
+    "Rupee ends flat against dollar - Mint",
+    hours_ago=3,
+    source="Mint",
+)
+
+
+def test_link_key_ignores_www_slash_and_tracking():
+    a = make_item("Moneycontrol", "https://www.example.com/a/1/?utm_source=rss", "A")
+    b = make_item("Moneycontrol", "https://example.com/a/1", "B")
+
+    assert set(story_keys(a)) & set(story_keys(b))
+
+
+def test_link_key_keeps_real_query_params():
+    a = make_item("Moneycontrol", "https://example.com/story?id=1", "A")
+    b = make_item("Moneycontrol", "https://example.com/story?id=2", "B")
+
+    assert not set(story_keys(a)) & set(story_keys(b))
+
+
+def test_google_news_syndication_is_deduplicated():
+    final = filter_last_window([GOOGLE_COPY, GOOGLE_UNIQUE, HINDU])
+
+    assert [it.link for it in final] == [HINDU.link, GOOGLE_UNIQUE.link]
+
+
+def test_duplicate_survivor_does_not_depend_on_input_order():
+    for items in ([HINDU, GOOGLE_COPY, GOOGLE_UNIQUE], [GOOGLE_UNIQUE, GOOGLE_COPY, HINDU]):
+        final = filter_last_window(items)
+        assert [it.feed for it in final if it.title.startswith("Sensex")] == ["The Hindu - Markets"]
+
+
+def test_placeholder_titles_are_not_used_as_keys():
+    a = make_item("Moneycontrol", "", "No title")
+    b = make_item("The Hindu - Markets", "", "No title")
+
+    assert len(filter_last_window([a, b])) == 2
+
+
+def test_every_feed_keeps_at_least_one_story():
+    fresh = make_item("Moneycontrol", "https://m.com/1", "Fresh", hours_ago=1)
+    old = make_item("BS Hindi - Markets News", "https://b.com/1", "Old", hours_ago=72)
+    older = make_item("BS Hindi - Markets News", "https://b.com/2", "Older", hours_ago=96)
+
+    final = filter_last_window([old, fresh, older])
+
+    assert [it.title for it in final] == ["Fresh", "Old"]
+
+
+def test_title_duplicates_do_not_cost_a_feed_its_guaranteed_story():
+    # Every Share Market story is a title match of a Markets News one,
+    # and Markets News comes first in FEEDS, so it wins the first pass
+    news = [make_item("BS Hindi - Markets News", f"https://b.com/news/{n}", f"Story {n}") for n in (1, 2)]
+    share = [make_item("BS Hindi - Share Market", f"https://b.com/share/{n}", f"Story {n}") for n in (1, 2)]
+
+    final = filter_last_window(share + news)
+
+    assert sum(it.feed == "BS Hindi - Markets News" for it in final) == 2
+    assert sum(it.feed == "BS Hindi - Share Market" for it in final) == 1
+
+
+def test_same_link_in_two_feeds_is_shown_once():
+    link = "https://hindi.business-standard.com/markets/story-1"
+    news = make_item("BS Hindi - Markets News", link, "Story")
+    share = make_item("BS Hindi - Share Market", link, "Story")
+
+    final = filter_last_window([share, news])
+
+    assert [it.feed for it in final] == ["BS Hindi - Markets News"]
@@ -0,0 +1,142 @@
+import io
+from datetime import datetime, timezone
+
+import pytest
+
+from app import extract_image, get_publisher_name, parse_date, parse_rss_stream
+
+
+def parse(xml):
+    return list(parse_rss_stream(io.BytesIO(xml.encode("utf-8"))))
+
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"
+     xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Markets</title>
+    <item>
+      <title><![CDATA[Sensex & Nifty close higher]]></title>
+      <link>https://example.com/markets/1</link>
+      <description>&lt;p&gt;Long HTML summary&lt;/p&gt;</description>
+      <pubDate>Mon, 01 Jan 2024 10:00:00 +0530</pubDate>
+      <media:content url="https://img.example.com/1.jpg" medium="image"/>
+      <source url="https://www.thehindu.com">The Hindu</source>
+    </item>
+    <item>
+      <title>Grouped media</title>
+      <link>https://example.com/markets/2</link>
+      <dc:date>2024-01-02T08:30:00Z</dc:date>
+      <media:group>
+        <media:thumbnail url="https://img.example.com/2-thumb.jpg"/>
+      </media:group>
+    </item>
+    <item>
+      <title>Enclosure only</title>
+      <link>https://example.com/markets/3</link>
+      <enclosure url="https://img.example.com/3.png" type="image/png" length="1"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom feed</title>
+  <entry>
+    <title>Atom story</title>
+    <link rel="enclosure" type="image/jpeg" href="https://img.example.com/a.jpg"/>
+    <link rel="alternate" href="https://example.com/atom/1"/>
+    <published>2024-03-01T12:00:00+05:30</published>
+    <updated>2024-03-02T12:00:00+05:30</updated>
+    <summary>Not kept</summary>
+    <source><title>Economic Times</title></source>
+  </entry>
+</feed>
+"""
+
+
+def test_rss_item_fields():
+    first, second, third = parse(RSS)
+
+    assert first == {
+        "links": [],
+        "title": "Sensex & Nifty close higher",
+        "link": "https://example.com/markets/1",
+        "published": "Mon, 01 Jan 2024 10:00:00 +0530",
+        "source": {"title": "The Hindu"},
+        "media_content": [{"url": "https://img.example.com/1.jpg", "medium": "image"}],
+    }
+    assert second["updated"] == "2024-01-02T08:30:00Z"
+    assert second["media_thumbnail"] == [{"url": "https://img.example.com/2-thumb.jpg"}]
+    assert third["links"] == [{"type": "image/png", "href": "https://img.example.com/3.png"}]
+
+
+def test_rss_summary_is_not_collected():
+    assert all("summary" not in entry for entry in parse(RSS))
+
+
+def test_atom_entry_fields():
+    (entry,) = parse(ATOM)
+
+    assert entry["title"] == "Atom story"
+    assert entry["link"] == "https://example.com/atom/1"
+    assert entry["published"] == "2024-03-01T12:00:00+05:30"
+    assert entry["updated"] == "2024-03-02T12:00:00+05:30"
+    assert entry["source"] == {"title": "Economic Times"}
+    assert "summary" not in entry
+
+
+def test_image_and_publisher_from_parsed_entries():
+    first, second, third = parse(RSS)
+
+    assert extract_image(first) == "https://img.example.com/1.jpg"
+    assert extract_image(second) == "https://img.example.com/2-thumb.jpg"
+    assert extract_image(third) == "https://img.example.com/3.png"
+    assert extract_image(parse(ATOM)[0]) == "https://img.example.com/a.jpg"
+
+    assert get_publisher_name("Feed", first) == "The Hindu"
+    assert get_publisher_name("Feed", second) == "Feed"
+
+
+def test_malformed_xml_is_recovered():
+    xml = """<rss><channel>
+      <item><title>Bonds & rupee</title><link>https://example.com/b</link></item>
+      <item><title>Still parsed</title></item>
+    </channel></rss>"""
+
+    titles = [entry.get("title") for entry in parse(xml)]
+
+    assert titles[-1] == "Still parsed"
+    assert len(titles) == 2
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "",
+        "<html><body>502 Bad Gateway</body></html>",
+        "<rss><channel><title>No stories</title></channel></rss>",
+    ],
+)
+def test_bodies_without_stories_yield_nothing(body):
+    assert parse(body) == []
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Mon, 01 Jan 2024 10:00:00 +0530", datetime(2024, 1, 1, 4, 30, tzinfo=timezone.utc)),
+        ("Mon, 01 Jan 2024 10:00:00 GMT", datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)),
+        ("2024-01-02T08:30:00Z", datetime(2024, 1, 2, 8, 30, tzinfo=timezone.utc)),
+        ("2024-03-01T12:00:00+05:30", datetime(2024, 3, 1, 6, 30, tzinfo=timezone.utc)),
+        # no offset at all → assumed UTC
+        ("2024-03-01T12:00:00", datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)),
+        ("not a date", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected